@@ -1,5 +1,4 @@
-import asyncio
-from bnc_anc_pkg.main import main
+from bnc_anc_pkg.main import main, run
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,7 +1,8 @@
 import os
 import json
+import orjson
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, FrozenSet, List
 
 BINANCE_API_KEY = os.getenv("BINANCE_API_KEY")
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET")
@@ -27,9 +28,11 @@ MARGIN_MODE = _conf.get("margin_mode", "ISOLATED")
 
 TOPIC = "com_announcement_en"
 BASE_WS = "wss://api.binance.com/sapi/wss"
-CATALOG_FILTER = {48, 161}
+CATALOG_FILTER = frozenset((48, 161))
 
 TEST_MODE = bool(_conf.get("test_mode", False))
+# run a heavy synchronous decision hook in the default thread pool instead of inline
+DECIDE_IN_EXECUTOR = bool(_conf.get("decide_in_executor", False))
 
 
 @dataclass
@@ -49,7 +52,11 @@ class MarketConfig:
 @dataclass
 class DecisionConfig:
     side: str
-    exchanges: List[str]
+    exchanges: FrozenSet[str]
+
+    def __post_init__(self):
+        # O(1) exchange lookups when a decision's targets are first planned
+        self.exchanges = frozenset(self.exchanges)
 
 
 def _market_cfg(data: Dict[str, Dict[str, float]]) -> MarketConfig:
@@ -67,3 +74,11 @@ for ex_name, ex_cfg in _conf.get("trading", {}).items():
 DECISION_CONFIG: Dict[str, DecisionConfig] = {
     k: DecisionConfig(**v) for k, v in _conf.get("decision", {}).items()
 }
+
+# rendered once for the startup notice; orjson serializes the dataclasses natively
+CFG_REPR = orjson.dumps(TRADING_CONFIG).decode()
+# exchange sets are listed sorted so the notice reads the same on every start
+DECISION_REPR = orjson.dumps(DECISION_CONFIG, default=sorted).decode()
+
+# every exchange some decision trades on, resolved once at load
+AUTO_ENABLED_EXCHANGES: List[str] = sorted({n for rule in DECISION_CONFIG.values() for n in rule.exchanges})
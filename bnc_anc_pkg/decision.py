@@ -1,64 +1,69 @@
 import re
+from functools import lru_cache
 from typing import Set, Tuple, List
 
 BTC_ALIAS = {"BTC": "XBT"}
 
+_RX_DELIST = re.compile(r"delist\s+(.+)", re.I)
+# whole comma/whitespace-delimited words only, so "(FOO)" or "FOO-BAR" don't count
+_RX_DELIST_TOKEN = re.compile(r"(?<![^\s,])[A-Z0-9]{2,15}(?![^\s,])")
+_DELIST_STOPWORDS = frozenset({"USDT", "USDC", "USD", "AND"})
+_RX_PAREN = re.compile(r"\(([A-Z0-9]{2,15})\)")
+_RX_USDT = re.compile(r"\b([A-Z0-9]{2,30})USDT\b")
+# one pass classifies the title; group 1 marks a delisting trigger and
+# "futures will launch" is covered by "will launch"
+_RX_EVENT = re.compile(r"(will delist|\bdelist\b)|will (?:add|list|be available|launch)", re.I)
+
 
 def _bases_from_parentheses(title: str) -> Set[str]:
-    out: Set[str] = set()
-    for tok in re.findall(r"\(([A-Z0-9]{2,15})\)", title or ""):
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", tok):
-            continue
-        if tok.upper() in {"USDT", "USDC", "USD", "FUTURES", "ALPHA"}:
-            pass
-        out.add(tok.upper())
-    return out
+    # the pattern only admits [A-Z0-9], so dates like (2025-01-01) never match
+    return set(_RX_PAREN.findall(title or ""))
 
 
 def _bases_from_usdt_pairs(title: str) -> Set[str]:
-    return {m.upper() for m in re.findall(r"\b([A-Z0-9]{2,30})USDT\b", title or "")}
+    return {m.upper() for m in _RX_USDT.findall(title or "")}
 
 
 def _bases_from_delist(title: str) -> Set[str]:
-    m = re.search(r"delist\s+(.+)", title or "", flags=re.I)
+    m = _RX_DELIST.search(title or "")
     if not m:
         return set()
-    seg = m.group(1)
-    seg = seg.split(" on ")[0]
-    parts = re.split(r"[,\s]+and\s+|,\s*|\s+", seg)
-    out: Set[str] = set()
-    for p in parts:
-        tok = p.strip().upper()
-        if not re.fullmatch(r"[A-Z0-9]{2,15}", tok):
-            continue
-        if tok in {"USDT", "USDC", "USD"}:
-            continue
-        out.add(tok)
-    return out
+    # drop the "on <date>" tail before scanning for tickers
+    seg = m.group(1).split(" on ")[0].upper()
+    return {tok for tok in _RX_DELIST_TOKEN.findall(seg) if tok not in _DELIST_STOPWORDS}
 
 
-def decide_event_from_title(title: str) -> Tuple[str, List[str]]:
-    if not title:
-        return "none", []
-    tl = title.lower()
-    if "will delist" in tl or re.search(r"\bdelist\b", tl):
+def _classify(title: str) -> str:
+    kind = "none"
+    for m in _RX_EVENT.finditer(title):
+        # delisting wins wherever it appears in the title
+        if m.group(1):
+            return "delisting"
+        kind = "listing"
+    return kind
+
+
+@lru_cache(maxsize=4096)
+def _decide(title: str) -> Tuple[str, Tuple[str, ...]]:
+    kind = _classify(title)
+    if kind == "delisting":
         bases = _bases_from_delist(title)
-        return ("delisting", sorted(bases)) if bases else ("none", [])
-    if any(
-        k in tl
-        for k in (
-            "will add",
-            "will list",
-            "will be available",
-            "will launch",
-            "futures will launch",
-        )
-    ):
+        return ("delisting", tuple(sorted(bases))) if bases else ("none", ())
+    if kind == "listing":
         bases = set()
         bases |= _bases_from_parentheses(title)
         bases |= _bases_from_usdt_pairs(title)
-        return ("listing", sorted(bases)) if bases else ("none", [])
-    return "none", []
+        return ("listing", tuple(sorted(bases))) if bases else ("none", ())
+    return "none", ()
+
+
+def decide_event_from_title(title: str) -> Tuple[str, List[str]]:
+    if not title:
+        return "none", []
+    # republished titles (even with different spacing) hit the cache; callers
+    # get their own list
+    decision, bases = _decide(" ".join(title.split()))
+    return decision, list(bases)
 
 # backwards compatibility
 decide_trade_from_title = decide_event_from_title
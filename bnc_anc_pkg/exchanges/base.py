@@ -1,16 +1,138 @@
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+from .session import KEEPALIVE_TIMEOUT
+
+# returned by trade() to callers that joined an order already in flight; the
+# caller that placed it gets the real result, so each order is reported once
+COALESCED = object()
+
+# concurrent GETs per client; order writes bypass the limit
+MAX_CONCURRENT_READS = 32
+
+# (symbol, side, notional, tp_pct, sl_pct, leverage)
+TradeKey = Tuple[str, str, float, float, float, int]
+
 
 class ExchangeClient(ABC):
     name: str = "abstract"
     market: str = "spot"
+    # cheap GET that completes a TLS round-trip, and how many connections warm() opens with it
+    warm_path: str = ""
+    warm_connections: int = 0
+
+    def __init__(self):
+        # order in flight per trade parameters; identical repeats join it instead of trading twice
+        self._inflight: Dict[TradeKey, asyncio.Task] = {}
+        self._read_sem = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    async def _req(self, method: str, path: str, *args, **kwargs) -> Any:
+        if method == "GET":
+            # bursts of status/price polls queue here instead of crowding out order POSTs
+            async with self._read_sem:
+                return await self._send(method, path, *args, **kwargs)
+        return await self._send(method, path, *args, **kwargs)
+
+    @abstractmethod
+    async def _send(self, method: str, path: str, *args, **kwargs) -> Any:
+        """Sign and send one request to the venue."""
 
     @abstractmethod
     def symbol_from_base(self, base: str) -> str:
         ...
 
-    @abstractmethod
     async def trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
+        """Place the order, or wait for an identical one still in flight.
+
+        Only a call with the same symbol, side, size, TP/SL and leverage joins an
+        order; it gets COALESCED back once that order settles, whatever its
+        outcome, while the caller that placed it gets the result or the error.
+        """
+        key = (symbol, side, notional, tp_pct, sl_pct, leverage)
+        task = self._inflight.get(key)
+        if task is not None:
+            with contextlib.suppress(Exception):
+                await asyncio.shield(task)
+            return COALESCED
+        task = asyncio.create_task(
+            self._trade(
+                symbol=symbol,
+                side=side,
+                notional=notional,
+                tp_pct=tp_pct,
+                sl_pct=sl_pct,
+                leverage=leverage,
+            )
+        )
+        self._inflight[key] = task
+        task.add_done_callback(partial(self._trade_done, key))
+        return await asyncio.shield(task)
+
+    def _trade_done(self, key: TradeKey, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    @abstractmethod
+    async def _trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
+        ...
+
+    @abstractmethod
+    async def cancel_order(self, symbol: str, order_id: str):
         ...
 
+    @abstractmethod
+    def _order_id(self, res) -> str:
+        """Order id from the venue's order placement response."""
+
+    async def _check_bracket(self, symbol: str, tp_res, sl_res) -> None:
+        """Raise if a TP/SL leg failed, cancelling the other one so it never fires alone."""
+        legs = (("TP", tp_res), ("SL", sl_res))
+        problems = [f"{name} failed ({res})" for name, res in legs if isinstance(res, BaseException)]
+        if not problems:
+            return
+        for name, res in legs:
+            if isinstance(res, BaseException):
+                continue
+            oid = self._order_id(res)
+            try:
+                await self.cancel_order(symbol, oid)
+                problems.append(f"{name} cancelled")
+            except Exception as e:
+                problems.append(f"{name} order {oid} left open, cancel failed ({e})")
+        raise RuntimeError(f"{symbol} position is open without TP/SL: {'; '.join(problems)}")
+
+    async def _open_connections(self):
+        results = await asyncio.gather(
+            *(self._req("GET", self.warm_path) for _ in range(self.warm_connections)),
+            return_exceptions=True,
+        )
+        # one failed socket is fine; none opening at all is worth reporting
+        if results and all(isinstance(r, BaseException) for r in results):
+            raise results[0]
+
+    async def _keepalive(self):
+        """Touch the pooled connections before the connector reaps them as idle."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_TIMEOUT - 5)
+            with contextlib.suppress(Exception):
+                await self._open_connections()
+
+    def _start_keepalive(self):
+        if not self._keepalive_task or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def warm(self):
+        """Open warm_connections TLS sessions ahead of the first order and keep them alive."""
+        if not self.warm_connections:
+            return
+        await self._open_connections()
+        self._start_keepalive()
+
     async def close(self):
-        pass
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            with contextlib.suppress(BaseException):
+                await self._keepalive_task
@@ -1,74 +1,217 @@
-import json, hmac, hashlib, time, uuid, base64, asyncio, contextlib
-from typing import Optional, Dict, Any, Tuple
+import hmac, hashlib, time, secrets, base64, asyncio, contextlib, math
+from typing import Optional, Dict, Any, List, Tuple
 from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from functools import lru_cache
+import logging
 import aiohttp
+import orjson
 from urllib.parse import urlencode
 from .base import ExchangeClient
+from .session import get_shared_session
 from ..decision import BTC_ALIAS
 
+log = logging.getLogger(__name__)
+
 KC_BASE = "https://api-futures.kucoin.com"
 ST_ORDERS_PATH = "/api/v1/st-orders"
 ORDERS_PATH = "/api/v1/orders"
-CONTRACT_DETAIL = "/api/v1/contracts/{symbol}"
-MARK_PRICE_PATH = "/api/v1/mark-price/{symbol}/current"
 TICKER_PATH = "/api/v1/ticker"
 POSITIONS_PATH = "/api/v1/positions"
-CANCEL_ORDER_PATH = "/api/v1/orders/{order_id}"
 BULLET_PRIVATE = "/api/v1/bullet-private"
+TIMESTAMP_PATH = "/api/v1/timestamp"
+ACTIVE_CONTRACTS_PATH = "/api/v1/contracts/active"
 
+# pre-bound for the per-request signing path
+_b64e = base64.b64encode
+_time_ns = time.time_ns
+# 32 hex chars: a valid clientOid (<= 40 chars) without building a UUID object
+_token_hex = secrets.token_hex
 
-def _round_down_to_tick(px: float, tick: float) -> str:
-    if tick <= 0:
-        return str(px)
+WARM_CONNECTIONS = 4
+# contract specs (tickSize, multiplier, lotSize) change rarely
+CONTRACT_CACHE_TTL = 6 * 3600
+# bulk refresh of every active contract, well inside the TTL
+CONTRACT_REFRESH_INTERVAL = 600
+# how long trade() waits for the entry fill on the order WS before polling /positions
+FILL_WAIT_TIMEOUT = 3.0
+TRADE_ORDERS_TOPIC = "/contractMarket/tradeOrders"
+# /positions fallback: first retry after 20ms, growing to at most 0.5s
+POLL_ATTEMPTS = 60
+POLL_DELAY_MIN = 0.02
+POLL_DELAY_MAX = 0.5
+POLL_BACKOFF = 1.6
+# contract spec lookups retried once the entry is in, before giving up on TP/SL
+CONTRACT_RETRIES = 2
+CONTRACT_RETRY_DELAY = 0.2
+
+
+# prices are scaled to integers up to this many tick decimals
+MAX_SCALED_DECIMALS = 12
+# px * scale within this many ulps of an integer is treated as exact
+_SCALE_ULPS = 4
+
+
+@lru_cache(maxsize=1024)
+def _endpoint(path: str, params: Tuple[Tuple[str, str], ...]) -> str:
+    """Signed endpoint for a query; the same few symbol lookups repeat all day."""
+    return f"{path}?{urlencode(params)}"
+
+
+@lru_cache(maxsize=None)
+def _tick_scale(tick: float) -> Tuple[int, int, int]:
+    """(decimals, 10**decimals, tick in scaled integer units) for a tick size."""
+    exp = Decimal(str(tick)).normalize().as_tuple().exponent
+    dec = max(-exp, 0)
+    scale = 10**dec
+    return dec, scale, round(tick * scale)
+
+
+def _scaled_units(px: float, scale: int, up: bool) -> int:
+    x = px * scale
+    n = round(x)
+    if abs(x - n) <= _SCALE_ULPS * math.ulp(x):
+        return n
+    return math.ceil(x) if up else math.floor(x)
+
+
+def _format_units(q: int, dec: int, scale: int) -> str:
+    if not dec:
+        return str(q)
+    sign = "-" if q < 0 else ""
+    whole, frac = divmod(abs(q), scale)
+    return f"{sign}{whole}.{frac:0{dec}d}"
+
+
+def _round_decimal(px: float, tick: float, rounding: str) -> str:
     q = Decimal(str(tick))
     d = Decimal(str(px))
-    steps = (d / q).to_integral_value(rounding=ROUND_DOWN)
+    steps = (d / q).to_integral_value(rounding=rounding)
     return str(steps * q)
 
 
+def _round_down_to_tick(px: float, tick: float) -> str:
+    if tick <= 0:
+        return str(px)
+    dec, scale, tick_int = _tick_scale(tick)
+    if dec > MAX_SCALED_DECIMALS:
+        return _round_decimal(px, tick, ROUND_DOWN)
+    n = _scaled_units(px, scale, up=False)
+    return _format_units(n // tick_int * tick_int, dec, scale)
+
+
 def _round_up_to_tick(px: float, tick: float) -> str:
     if tick <= 0:
         return str(px)
-    q = Decimal(str(tick))
-    d = Decimal(str(px))
-    steps = (d / q).to_integral_value(rounding=ROUND_UP)
-    return str(steps * q)
+    dec, scale, tick_int = _tick_scale(tick)
+    if dec > MAX_SCALED_DECIMALS:
+        return _round_decimal(px, tick, ROUND_UP)
+    n = _scaled_units(px, scale, up=True)
+    return _format_units(-(-n // tick_int) * tick_int, dec, scale)
 
 
-def _calc_raw_tp_sl(ref_price: float, side: str, tp_pct: float, sl_pct: float) -> Tuple[float, float]:
-    s = side.lower()
-    if s == "buy":
-        return ref_price * (1 + tp_pct / 100.0), ref_price * (1 - sl_pct / 100.0)
-    if s == "sell":
-        return ref_price * (1 - tp_pct / 100.0), ref_price * (1 + sl_pct / 100.0)
-    raise ValueError("side must be 'buy' or 'sell'")
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # marks a failure nobody awaits as retrieved, so asyncio does not log it
+    if not task.cancelled():
+        task.exception()
+
+
+def _tp_sl_prices(ref_price: float, side_sign: int, tp_pct: float, sl_pct: float, tick: float) -> Tuple[str, str]:
+    """Tick-rounded TP/SL for a long (+1) or short (-1) entry, both rounded away from the entry."""
+    tp = ref_price * (1 + side_sign * tp_pct / 100.0)
+    sl = ref_price * (1 - side_sign * sl_pct / 100.0)
+    if side_sign > 0:
+        return _round_up_to_tick(tp, tick), _round_down_to_tick(sl, tick)
+    return _round_down_to_tick(tp, tick), _round_up_to_tick(sl, tick)
 
 
 class KuCoinFuturesClient(ExchangeClient):
     name = "kucoin"
     market = "futures"
+    # server time is the cheapest round-trip that still completes TLS
+    warm_path = TIMESTAMP_PATH
+    warm_connections = WARM_CONNECTIONS
 
-    def __init__(self, key: str, secret: str, passphrase: str, key_version: str = "3"):
+    def __init__(
+        self,
+        key: str,
+        secret: str,
+        passphrase: str,
+        key_version: str = "3",
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        super().__init__()
         self.key, self.secret, self.passphrase_plain = key, secret, passphrase
         self.key_version = str(key_version or "3").strip()
-        to = aiohttp.ClientTimeout(total=2.2, connect=0.3, sock_connect=0.3, sock_read=1.0)
-        self.session = aiohttp.ClientSession(
-            timeout=to,
-            connector=aiohttp.TCPConnector(limit=128, ttl_dns_cache=300, ssl=True, keepalive_timeout=30),
-        )
-        # websocket session for private order updates
-        self.ws_session = aiohttp.ClientSession()
+        self._secret_bytes = secret.encode()
+        # keyed once, copied per request to skip the HMAC key setup
+        self._hmac = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
+        # v2/v3 keys send the passphrase signed with the secret; it never changes
+        if self.key_version in ("2", "3"):
+            self._psp = _b64e(hmac.digest(self._secret_bytes, passphrase.encode(), "sha256")).decode()
+        else:
+            self._psp = passphrase
+        # static part of the auth headers; _sign only adds signature and timestamp
+        self._hdr_base = {
+            "KC-API-KEY": key,
+            "KC-API-PASSPHRASE": self._psp,
+            "KC-API-KEY-VERSION": self.key_version,
+            "Content-Type": "application/json",
+        }
+        self._timeout = aiohttp.ClientTimeout(total=2.2, connect=0.3, sock_connect=0.3, sock_read=1.0)
+        # borrowed pool, also used for the private order-update websocket
+        self.session = session or get_shared_session()
         self._ws_task: Optional[asyncio.Task] = None
+        self._contracts_task: Optional[asyncio.Task] = None
         # map order_id -> sibling order_id for tp/sl pairs
         self._order_pairs: Dict[str, str] = {}
+        # set while the order-update stream is subscribed and delivering fills
+        self._ws_ready = asyncio.Event()
+        # entry clientOid -> future for (avg fill price, filled size), plus the
+        # [cost, size] accumulated from its match events so far
+        self._fills: Dict[str, asyncio.Future] = {}
+        self._fill_acc: Dict[str, List[float]] = {}
+        # symbol -> (monotonic ts, contract spec)
+        self._contract_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     async def close(self):
-        await self.session.close()
-        await self.ws_session.close()
-        if self._ws_task:
-            self._ws_task.cancel()
+        for task in (self._ws_task, self._contracts_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(BaseException):
+                    await task
+        await super().close()
+
+    async def warm(self):
+        """Open WARM_CONNECTIONS TLS sessions and load every active contract spec."""
+        steps = ("connection warm-up", "contract priming")
+        results = await asyncio.gather(
+            self._open_connections(),
+            self._prime_contracts(),
+            return_exceptions=True,
+        )
+        for step, res in zip(steps, results):
+            if isinstance(res, BaseException):
+                # not fatal: connections open and specs load on the first trade instead
+                log.warning("KuCoin %s failed", step, exc_info=res)
+        self._start_keepalive()
+        if not self._contracts_task or self._contracts_task.done():
+            self._contracts_task = asyncio.create_task(self._refresh_contracts_loop())
+        # subscribe to order updates now so the first trade can wait on its fill
+        await self._ensure_ws()
+
+    async def _prime_contracts(self):
+        specs = (await self._req("GET", ACTIVE_CONTRACTS_PATH))["data"]
+        now = time.monotonic()
+        for spec in specs or ():
+            symbol = spec.get("symbol")
+            if symbol:
+                self._contract_cache[symbol] = (now, spec)
+
+    async def _refresh_contracts_loop(self):
+        while True:
+            await asyncio.sleep(CONTRACT_REFRESH_INTERVAL)
             with contextlib.suppress(Exception):
-                await self._ws_task
+                await self._prime_contracts()
 
     def symbol_from_base(self, base: str) -> str:
         base = base.upper()
@@ -76,42 +219,31 @@ class KuCoinFuturesClient(ExchangeClient):
         return f"{base}USDTM"
 
     def _ts_ms(self) -> str:
-        return str(int(time.time() * 1000))
+        return str(_time_ns() // 1_000_000)
 
-    def _sign(self, method: str, endpoint: str, body_str: str) -> Dict[str, str]:
+    def _sign(self, method: str, endpoint: str, body: bytes) -> Dict[str, str]:
         ts = self._ts_ms()
-        prehash = f"{ts}{method.upper()}{endpoint}{body_str}"
-        sig = base64.b64encode(hmac.new(self.secret.encode(), prehash.encode(), hashlib.sha256).digest()).decode()
-        kv = self.key_version
-        if kv in ("2", "3"):
-            psp = base64.b64encode(hmac.new(self.secret.encode(), self.passphrase_plain.encode(), hashlib.sha256).digest()).decode()
-        else:
-            psp = self.passphrase_plain
-        return {
-            "KC-API-KEY": self.key,
-            "KC-API-SIGN": sig,
-            "KC-API-TIMESTAMP": ts,
-            "KC-API-PASSPHRASE": psp,
-            "KC-API-KEY-VERSION": kv,
-            "Content-Type": "application/json",
-        }
+        h = self._hmac.copy()
+        h.update(f"{ts}{method.upper()}{endpoint}".encode())
+        h.update(body)
+        headers = self._hdr_base.copy()
+        headers["KC-API-SIGN"] = _b64e(h.digest()).decode()
+        headers["KC-API-TIMESTAMP"] = ts
+        return headers
 
-    async def _req(self, method: str, path: str, j: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, str]] = None) -> Any:
-        body = json.dumps(j, separators=(",", ":")) if j else ""
-        endpoint = path
-        if params:
-            qs = urlencode(params)
-            endpoint = f"{path}?{qs}"
+    async def _send(self, method: str, path: str, j: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, str]] = None) -> Any:
+        body = orjson.dumps(j) if j else b""
+        # the signed endpoint is sent verbatim so aiohttp never re-encodes the query
+        endpoint = _endpoint(path, tuple(sorted(params.items()))) if params else path
         headers = self._sign(method, endpoint, body)
-        url = KC_BASE + path
-        async with self.session.request(method, url, data=body if j else None, headers=headers, params=params) as r:
-            txt = await r.text()
+        async with self.session.request(method, f"{KC_BASE}{endpoint}", data=body if j else None, headers=headers, timeout=self._timeout) as r:
+            raw = await r.read()
             if r.status < 200 or r.status >= 300:
-                raise RuntimeError(f"{r.status} {r.reason}. Body={txt}")
+                raise RuntimeError(f"{r.status} {r.reason}. Body={raw.decode(errors='replace')}")
             try:
-                data = json.loads(txt)
+                data = orjson.loads(raw)
             except Exception:
-                return txt
+                return raw.decode(errors="replace")
             if isinstance(data, dict):
                 code = data.get("code")
                 if code is not None and str(code) != "200000":
@@ -120,25 +252,43 @@ class KuCoinFuturesClient(ExchangeClient):
             return data
 
     async def get_contract(self, symbol: str) -> Dict[str, Any]:
-        return (await self._req("GET", CONTRACT_DETAIL.replace("{symbol}", symbol)))["data"]
+        cached = self._contract_cache.get(symbol)
+        now = time.monotonic()
+        if cached and now - cached[0] < CONTRACT_CACHE_TTL:
+            return cached[1]
+        spec = (await self._req("GET", f"/api/v1/contracts/{symbol}"))["data"]
+        self._contract_cache[symbol] = (now, spec)
+        return spec
+
+    async def _contract_after_entry(self, symbol: str) -> Dict[str, Any]:
+        """Contract spec for an entry that is already filled, retried before giving up."""
+        for _ in range(CONTRACT_RETRIES):
+            await asyncio.sleep(CONTRACT_RETRY_DELAY)
+            try:
+                return await self.get_contract(symbol)
+            except Exception as e:
+                err = e
+        raise RuntimeError(f"{symbol} position is open without TP/SL: contract lookup failed ({err})")
 
     async def get_mark_index(self, symbol: str) -> Tuple[float, float]:
-        d = (await self._req("GET", MARK_PRICE_PATH.replace("{symbol}", symbol)))["data"]
+        d = (await self._req("GET", f"/api/v1/mark-price/{symbol}/current"))["data"]
         return float(d["value"]), float(d["indexPrice"])
 
     async def get_last_price(self, symbol: str) -> float:
-        d = (await self._req("GET", TICKER_PATH, params={"symbol": symbol}))["data"]
+        d = (await self._req("GET", _endpoint(TICKER_PATH, (("symbol", symbol),))))["data"]
         return float(d.get("price") or d.get("lastTradedPrice") or d.get("indexPrice"))
 
     async def get_position(self, symbol: str) -> Dict[str, Any]:
-        d = (await self._req("GET", POSITIONS_PATH, params={"symbol": symbol}))["data"]
+        d = (await self._req("GET", _endpoint(POSITIONS_PATH, (("symbol", symbol),))))["data"]
         if isinstance(d, list):
             return d[0] if d else {}
         return d or {}
 
-    async def cancel_order(self, order_id: str):
-        path = CANCEL_ORDER_PATH.replace("{order_id}", order_id)
-        await self._req("DELETE", path)
+    async def cancel_order(self, symbol: str, order_id: str):
+        await self._req("DELETE", f"{ORDERS_PATH}/{order_id}")
+
+    def _order_id(self, res) -> str:
+        return res.get("data", {}).get("orderId")
 
     async def _get_ws_url(self) -> Tuple[str, float]:
         """Get websocket URL and ping interval."""
@@ -154,45 +304,95 @@ class KuCoinFuturesClient(ExchangeClient):
             return
         self._ws_task = asyncio.create_task(self._watch_orders_ws())
 
+    def _on_entry_update(self, client_oid: str, od: Dict[str, Any]):
+        """Aggregate match events for a pending entry and resolve its future once done."""
+        acc = self._fill_acc.setdefault(client_oid, [0.0, 0.0])
+        if od.get("type") == "match":
+            size = float(od.get("matchSize") or 0)
+            acc[0] += float(od.get("matchPrice") or 0) * size
+            acc[1] += size
+        if (od.get("status") or "").lower() != "done":
+            return
+        fut = self._fills.get(client_oid)
+        if fut is None or fut.done():
+            return
+        if acc[1]:
+            fut.set_result((acc[0] / acc[1], acc[1]))
+        else:
+            fut.set_exception(RuntimeError(f"entry order {od.get('type') or 'done'} without fills"))
+
+    async def _wait_fill(self, client_oid: str) -> Tuple[float, float]:
+        """(avg price, size) of an entry from the order WS; zeros when it cannot tell."""
+        fut = self._fills.get(client_oid)
+        if fut is None:
+            return 0.0, 0.0
+        try:
+            return await asyncio.wait_for(fut, FILL_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            return 0.0, 0.0
+
+    async def _position_entry(self, symbol: str) -> Tuple[float, float]:
+        """(avg entry price, size) polled from the open position."""
+        delay = POLL_DELAY_MIN
+        for _ in range(POLL_ATTEMPTS):
+            pos = await self.get_position(symbol)
+            ref_price = float(pos.get("avgEntryPrice") or pos.get("entryPrice") or 0)
+            if ref_price:
+                qty = float(pos.get("currentQty") or pos.get("pos") or pos.get("size") or 0)
+                return ref_price, abs(qty)
+            await asyncio.sleep(delay)
+            delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
+        raise RuntimeError("entry price not found for position")
+
     async def _watch_orders_ws(self):
-        """Background websocket listener to cancel sibling orders."""
+        """Background websocket listener that resolves entry fills and cancels sibling orders."""
         while True:
             try:
                 url, ping_interval = await self._get_ws_url()
-                async with self.ws_session.ws_connect(url, heartbeat=ping_interval) as ws:
+                async with self.session.ws_connect(url, heartbeat=ping_interval) as ws:
+                    sub_id = _token_hex(16)
                     sub = {
-                        "id": str(uuid.uuid4()),
+                        "id": sub_id,
                         "type": "subscribe",
-                        "topic": "/contractMarket/tradeOrders",
+                        "topic": TRADE_ORDERS_TOPIC,
                         "privateChannel": True,
                     }
-                    await ws.send_json(sub)
+                    await ws.send_str(orjson.dumps(sub).decode())
                     async for msg in ws:
                         if msg.type != aiohttp.WSMsgType.TEXT:
                             continue
                         try:
-                            data = json.loads(msg.data)
+                            data = orjson.loads(msg.data)
                         except Exception:
                             continue
-                        if data.get("topic") != "/contractMarket/tradeOrders":
+                        if data.get("topic") != TRADE_ORDERS_TOPIC:
+                            if data.get("type") == "ack" and data.get("id") == sub_id:
+                                self._ws_ready.set()
                             continue
                         od = data.get("data") or {}
+                        client_oid = od.get("clientOid")
+                        if client_oid in self._fills:
+                            self._on_entry_update(client_oid, od)
                         oid = od.get("orderId")
                         status = (od.get("status") or "").lower()
                         if not oid or status not in {"done", "filled", "match", "cancelled", "canceled"}:
                             continue
                         other = self._order_pairs.pop(oid, None)
                         if other:
-                            await self.cancel_order(other)
+                            await self.cancel_order(od.get("symbol"), other)
                             self._order_pairs.pop(other, None)
             except Exception:
-                await asyncio.sleep(1)
+                pass
+            # fills may have been missed while disconnected; pending trades fall back to polling
+            self._ws_ready.clear()
+            await asyncio.sleep(1)
 
-    async def trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
-        spec = await self.get_contract(symbol)
-        tick = float(spec.get("tickSize") or 0.01)
+    async def _trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
+        side_sign = 1 if side[0] in "bB" else -1
+        tpsl_side = "sell" if side_sign > 0 else "buy"
+        client_oid = _token_hex(16)
         base = {
-            "clientOid": str(uuid.uuid4()),
+            "clientOid": client_oid,
             "side": side,
             "symbol": symbol,
             "type": "market",
@@ -203,37 +403,38 @@ class KuCoinFuturesClient(ExchangeClient):
         }
         body_v = dict(base)
         body_v["valueQty"] = str(notional)
-        await self._req("POST", ST_ORDERS_PATH, j=body_v)
-
-        # determine entry price from open position before placing tp/sl
-        ref_price = 0.0
-        await asyncio.sleep(0.2)
-        for _ in range(60):
-            pos = await self.get_position(symbol)
-            ref_price = float(pos.get("avgEntryPrice") or pos.get("entryPrice") or 0)
-            if ref_price:
-                break
-            await asyncio.sleep(0.5)
-        if not ref_price:
-            raise RuntimeError("entry price not found for position")
-        tp_raw, sl_raw = _calc_raw_tp_sl(ref_price, side, tp_pct, sl_pct)
-        if side.lower() == "buy":
-            tp_price = _round_up_to_tick(tp_raw, tick)
-            sl_price = _round_down_to_tick(sl_raw, tick)
-            tpsl_side = "sell"
-        else:
-            tp_price = _round_down_to_tick(tp_raw, tick)
-            sl_price = _round_up_to_tick(sl_raw, tick)
-            tpsl_side = "buy"
-
-        # determine position size for closing orders
-        qty = float(pos.get("currentQty") or pos.get("pos") or pos.get("size") or 0)
-        qty = abs(qty)
+        # registered before the POST so no fill event can slip past
+        if self._ws_ready.is_set():
+            self._fills[client_oid] = asyncio.get_running_loop().create_future()
+        # the tick size is only needed for TP/SL, so it loads while the entry fills
+        contract_task = asyncio.create_task(self.get_contract(symbol))
+        try:
+            try:
+                await self._req("POST", ST_ORDERS_PATH, j=body_v)
+                ref_price, qty = await self._wait_fill(client_oid)
+            finally:
+                self._fills.pop(client_oid, None)
+                self._fill_acc.pop(client_oid, None)
+            # no fill seen on the order WS: read the entry from the open position
+            if not ref_price:
+                ref_price, qty = await self._position_entry(symbol)
+        except BaseException:
+            # the entry error is the one to report; a lookup that already failed is dropped
+            contract_task.cancel()
+            contract_task.add_done_callback(_retrieve_exception)
+            raise
+        try:
+            spec = await contract_task
+        except Exception:
+            # the entry has filled: a failed lookup must not leave it unbracketed
+            spec = await self._contract_after_entry(symbol)
+        tick = float(spec.get("tickSize") or 0.01)
+        tp_price, sl_price = _tp_sl_prices(ref_price, side_sign, tp_pct, sl_pct, tick)
         if not qty:
             raise RuntimeError("position size not found")
 
         tp_req = {
-            "clientOid": str(uuid.uuid4()),
+            "clientOid": _token_hex(16),
             "symbol": symbol,
             "side": tpsl_side,
             "type": "limit",
@@ -244,7 +445,7 @@ class KuCoinFuturesClient(ExchangeClient):
         }
 
         sl_req = {
-            "clientOid": str(uuid.uuid4()),
+            "clientOid": _token_hex(16),
             "symbol": symbol,
             "side": tpsl_side,
             "type": "limit",
@@ -254,11 +455,15 @@ class KuCoinFuturesClient(ExchangeClient):
             "reduceOnly": True,
         }
         await self._ensure_ws()
-        tp_res = await self._req("POST", ORDERS_PATH, j=tp_req)
-        sl_res = await self._req("POST", ORDERS_PATH, j=sl_req)
+        tp_res, sl_res = await asyncio.gather(
+            self._req("POST", ORDERS_PATH, j=tp_req),
+            self._req("POST", ORDERS_PATH, j=sl_req),
+            return_exceptions=True,
+        )
+        await self._check_bracket(symbol, tp_res, sl_res)
 
-        tp_id = tp_res.get("data", {}).get("orderId")
-        sl_id = sl_res.get("data", {}).get("orderId")
+        tp_id = self._order_id(tp_res)
+        sl_id = self._order_id(sl_res)
         if tp_id and sl_id:
             self._order_pairs[tp_id] = sl_id
             self._order_pairs[sl_id] = tp_id
@@ -3,10 +3,15 @@ import time
 import hmac
 import hashlib
 import aiohttp
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, Optional, Tuple
 from .base import ExchangeClient
+from .session import get_shared_session
 
 MEXC_BASE = "https://api.mexc.com"
+ORDER_PATH = "/api/v3/order"
+PING_PATH = "/api/v3/ping"
+WARM_CONNECTIONS = 2
 
 
 def _calc_tp_sl(ref_price: float, side: str, tp_pct: float, sl_pct: float) -> tuple[float, float]:
@@ -18,43 +23,68 @@ def _calc_tp_sl(ref_price: float, side: str, tp_pct: float, sl_pct: float) -> tu
     raise ValueError("side must be 'buy' or 'sell'")
 
 
+def _ts_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _fill_of(order: Dict[str, Any]) -> Tuple[float, float]:
+    """(executed qty, average price) reported on a MEXC order."""
+    qty = float(order.get("executedQty") or 0)
+    price = float(
+        order.get("avgPrice")
+        or (float(order.get("cummulativeQuoteQty") or 0) / qty if qty else 0)
+    )
+    return qty, price
+
+
 class MexcSpotClient(ExchangeClient):
     name = "mexc"
     market = "spot"
+    warm_path = PING_PATH
+    warm_connections = WARM_CONNECTIONS
 
-    def __init__(self, key: str, secret: str):
+    def __init__(self, key: str, secret: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__()
         self.key = key
         self.secret = secret.encode()
-        to = aiohttp.ClientTimeout(total=3.0, connect=0.5, sock_connect=0.5, sock_read=2.0)
-        self.session = aiohttp.ClientSession(timeout=to)
-
-    async def close(self):
-        await self.session.close()
+        # keyed once, copied per request to skip the HMAC key setup
+        self._hmac = hmac.new(self.secret, digestmod=hashlib.sha256)
+        self._timeout = aiohttp.ClientTimeout(total=3.0, connect=0.5, sock_connect=0.5, sock_read=2.0)
+        self.session = session or get_shared_session()
 
     def symbol_from_base(self, base: str) -> str:
         return f"{base.upper()}USDT"
 
     def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
         qs = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-        sig = hmac.new(self.secret, qs.encode(), hashlib.sha256).hexdigest()
-        params["signature"] = sig
+        h = self._hmac.copy()
+        h.update(qs.encode())
+        params["signature"] = h.hexdigest()
         return params
 
-    async def _req(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def _send(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         params = params or {}
         url = MEXC_BASE + path
         headers = {"X-MEXC-APIKEY": self.key}
-        async with self.session.request(method, url, params=params, headers=headers) as r:
-            txt = await r.text()
+        async with self.session.request(method, url, params=params, headers=headers, timeout=self._timeout) as r:
+            raw = await r.read()
             if r.status < 200 or r.status >= 300:
-                raise RuntimeError(f"{r.status} {r.reason}. Body={txt}")
+                raise RuntimeError(f"{r.status} {r.reason}. Body={raw.decode(errors='replace')}")
             try:
-                return await r.json()
+                return orjson.loads(raw)
             except Exception:
-                return txt
+                return raw.decode(errors="replace")
+
+    async def cancel_order(self, symbol: str, order_id: str):
+        params = {"symbol": symbol, "orderId": order_id, "timestamp": _ts_ms()}
+        self._sign(params)
+        await self._req("DELETE", ORDER_PATH, params)
+
+    def _order_id(self, res) -> str:
+        return res.get("orderId")
 
-    async def trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
-        ts = int(time.time() * 1000)
+    async def _trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
+        ts = _ts_ms()
         params = {
             "symbol": symbol,
             "side": side.upper(),
@@ -63,27 +93,21 @@ class MexcSpotClient(ExchangeClient):
             "timestamp": ts,
         }
         self._sign(params)
-        order = await self._req("POST", "/api/v3/order", params)
+        order = await self._req("POST", ORDER_PATH, params)
         oid = order.get("orderId")
-        qty = float(order.get("executedQty") or 0)
-        price = float(
-            order.get("avgPrice")
-            or (float(order.get("cummulativeQuoteQty") or 0) / qty if qty else 0)
-        )
-        if order.get("status") != "FILLED" or not price:
+        filled = order.get("status") == "FILLED"
+        qty, price = _fill_of(order) if filled else (0.0, 0.0)
+        if not price:
+            # already FILLED but without a usable price: query right away
+            delay = 0 if filled else 0.1
             for _ in range(10):
-                await asyncio.sleep(0.1)
-                qs = {"symbol": symbol, "orderId": oid, "timestamp": int(time.time() * 1000)}
+                await asyncio.sleep(delay)
+                delay = 0.1
+                qs = {"symbol": symbol, "orderId": oid, "timestamp": _ts_ms()}
                 self._sign(qs)
-                info = await self._req("GET", "/api/v3/order", qs)
+                info = await self._req("GET", ORDER_PATH, qs)
                 if info.get("status") == "FILLED":
-                    qty = float(info.get("executedQty") or 0)
-                    price = float(
-                        info.get("avgPrice")
-                        or (
-                            float(info.get("cummulativeQuoteQty") or 0) / qty if qty else 0
-                        )
-                    )
+                    qty, price = _fill_of(info)
                     break
             if not price:
                 raise RuntimeError("entry price not found for order")
@@ -91,6 +115,8 @@ class MexcSpotClient(ExchangeClient):
         tp_price, sl_price = _calc_tp_sl(price, side, tp_pct, sl_pct)
         opp_side = "SELL" if side.lower() == "buy" else "BUY"
         qty_str = str(qty)
+        # both legs are signed back to back, one timestamp serves them
+        ts = _ts_ms()
 
         tp_params = {
             "symbol": symbol,
@@ -100,10 +126,9 @@ class MexcSpotClient(ExchangeClient):
             "price": f"{tp_price}",
             "stopPrice": f"{tp_price}",
             "timeInForce": "GTC",
-            "timestamp": int(time.time() * 1000),
+            "timestamp": ts,
         }
         self._sign(tp_params)
-        await self._req("POST", "/api/v3/order", tp_params)
 
         sl_params = {
             "symbol": symbol,
@@ -113,8 +138,13 @@ class MexcSpotClient(ExchangeClient):
             "price": f"{sl_price}",
             "stopPrice": f"{sl_price}",
             "timeInForce": "GTC",
-            "timestamp": int(time.time() * 1000),
+            "timestamp": ts,
         }
         self._sign(sl_params)
-        await self._req("POST", "/api/v3/order", sl_params)
+        tp_res, sl_res = await asyncio.gather(
+            self._req("POST", ORDER_PATH, tp_params),
+            self._req("POST", ORDER_PATH, sl_params),
+            return_exceptions=True,
+        )
+        await self._check_bracket(symbol, tp_res, sl_res)
         return {"tp": tp_price, "sl": sl_price}
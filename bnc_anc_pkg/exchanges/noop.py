@@ -8,6 +8,16 @@ class NoOpExchange(ExchangeClient):
     def symbol_from_base(self, base: str) -> str:
         return base
 
-    async def trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
+    async def _send(self, method: str, path: str, *args, **kwargs):
+        # nothing to reach: every request succeeds empty
+        return {}
+
+    async def cancel_order(self, symbol: str, order_id: str):
+        pass
+
+    def _order_id(self, res) -> str:
+        return res.get("orderId", "")
+
+    async def _trade(self, *, symbol: str, side: str, notional: float, tp_pct: float, sl_pct: float, leverage: int):
         await asyncio.sleep(0)
         return {"symbol": symbol, "side": side, "notional": notional}
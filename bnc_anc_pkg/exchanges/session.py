@@ -0,0 +1,33 @@
+from typing import Optional
+import aiohttp
+
+KEEPALIVE_TIMEOUT = 60
+
+# one pool for every exchange client, opened lazily inside the running loop
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Process-wide session; clients borrow it and never close it themselves."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        # c-ares resolver keeps DNS lookups off the default thread pool; on
+        # Windows aiodns requires the SelectorEventLoop policy
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=256,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                resolver=aiohttp.AsyncResolver(),
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+        )
+    return _SESSION
+
+
+async def close_shared_session() -> None:
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
@@ -1,32 +1,102 @@
 import asyncio
+import inspect
 import time
-from datetime import datetime, timezone
-from typing import List
+from functools import lru_cache, partial
+from typing import List, Tuple
 import logging
 
-from .config import CATALOG_FILTER, TRADING_CONFIG, DECISION_CONFIG, STOP_PRICE_TYPE
+from .config import (
+    CATALOG_FILTER,
+    DECIDE_IN_EXECUTOR,
+    TRADING_CONFIG,
+    DECISION_CONFIG,
+    STOP_PRICE_TYPE,
+    PositionConfig,
+)
 from .decision import decide_event_from_title
-from .telegram import push_telegram
-from .exchanges.base import ExchangeClient
+from .telegram import push_telegram, telegram_enabled
+from .exchanges.base import COALESCED, ExchangeClient
 
 log = logging.getLogger(__name__)
 
 
 def _now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    t = time.time()
+    return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(t))}.{int(t * 1000) % 1000:03d}"
+
+
+@lru_cache(maxsize=64)
+def _plan(decision: str, exchanges: Tuple[ExchangeClient, ...]) -> Tuple[Tuple[ExchangeClient, PositionConfig, str], ...]:
+    """Exchanges a configured decision trades on, with their position config and report line.
+
+    The config is static, so this is resolved once per decision and exchange set.
+    """
+    rule = DECISION_CONFIG[decision]
+    targets = []
+    for ex in exchanges:
+        if ex.name not in rule.exchanges:
+            continue
+        cfg = TRADING_CONFIG.get(ex.name, {}).get(ex.market)
+        if not cfg:
+            continue
+        pcfg = cfg.long if rule.side == "long" else cfg.short
+        summary = (
+            f"Nominal≈${pcfg.notional} Lev={pcfg.leverage}x TP={pcfg.tp_pct}% SL={pcfg.sl_pct}% Ref={STOP_PRICE_TYPE}"
+        )
+        targets.append((ex, pcfg, summary))
+    return tuple(targets)
+
+
+@lru_cache(maxsize=1024)
+def _symbol(ex: ExchangeClient, base: str) -> str:
+    """Exchange symbol for a base; the same tickers come back across announcements."""
+    return ex.symbol_from_base(base)
+
+
+def _report(
+    ex: ExchangeClient, symbol: str, summary: str, side_tag: str, about: str, start_perf: float, task: asyncio.Task
+):
+    elapsed = int((time.perf_counter() - start_perf) * 1000)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is None and task.result() is COALESCED:
+        # joined an identical order in flight; its own announcement reports it
+        log.debug("%s %s on %s joined an order in flight", side_tag, symbol, ex.name)
+        return
+    if exc is not None:
+        head = f"❌ {side_tag} {symbol} on {ex.name} failed\n{exc}\n"
+    else:
+        head = f"✅ {side_tag} {symbol} on {ex.name}\n"
+    msg = f"{head}{summary}\n{about}TradedAt: {_now()}\nExecTime: {elapsed}ms"
+    log.info(msg)
+    push_telegram(msg, urgent=True)
+
+
+async def _decide(title: str):
+    """Run the decision hook; the cached regex classifier is cheapest called inline."""
+    if inspect.iscoroutinefunction(decide_event_from_title):
+        return await decide_event_from_title(title)
+    if DECIDE_IN_EXECUTOR:
+        # opt-in for a hook slow enough to stall the WS loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, decide_event_from_title, title)
+    return decide_event_from_title(title)
 
 
 async def handle_payload(payload: dict, exchanges: List[ExchangeClient]):
-    recv_ts = _now()
     start_perf = time.perf_counter()
-    title = payload.get("title", "") or ""
+    title = payload.get("title") or ""
     category = payload.get("catalogId") or -1
+    # most announcements are ignored here: only format a timestamp if someone reads it
     if category not in CATALOG_FILTER:
-        msg = f"[received at: {recv_ts}] {title}: category {category} ignored"
-        push_telegram(msg)
+        if telegram_enabled():
+            push_telegram(f"[received at: {_now()}] {title}: category {category} ignored")
         return
 
-    decision, bases = decide_event_from_title(title)
+    recv_ts = _now()
+
+    decision, bases = await _decide(title)
     if decision == "none" or not bases:
         msg = f"[received at: {recv_ts}] {title}: NO TRADING DECISION"
         push_telegram(msg)
@@ -39,59 +109,32 @@ async def handle_payload(payload: dict, exchanges: List[ExchangeClient]):
         return
 
     side = "buy" if rule.side == "long" else "sell"
+    targets = _plan(decision, tuple(exchanges))
+
+    # nobody will read the report: skip formatting it
+    report = telegram_enabled() or log.isEnabledFor(logging.INFO)
+    if report:
+        side_tag = rule.side.upper()
+        about = f"Title: {title}\nReceivedAt: {recv_ts}\n"
 
     tasks = []
     for base in bases:
-        for ex in exchanges:
-            if ex.name not in rule.exchanges:
-                continue
-            cfg = TRADING_CONFIG.get(ex.name, {}).get(ex.market)
-            if not cfg:
-                continue
-            pos_cfg = cfg.long if rule.side == "long" else cfg.short
-            symbol = ex.symbol_from_base(base)
-            tasks.append(
-                (
-                    ex,
-                    symbol,
-                    pos_cfg,
-                    asyncio.create_task(
-                        ex.trade(
-                            symbol=symbol,
-                            side=side,
-                            notional=pos_cfg.notional,
-                            tp_pct=pos_cfg.tp_pct,
-                            sl_pct=pos_cfg.sl_pct,
-                            leverage=pos_cfg.leverage or 1,
-                        )
-                    ),
+        for ex, pos_cfg, summary in targets:
+            symbol = _symbol(ex, base)
+            task = asyncio.create_task(
+                ex.trade(
+                    symbol=symbol,
+                    side=side,
+                    notional=pos_cfg.notional,
+                    tp_pct=pos_cfg.tp_pct,
+                    sl_pct=pos_cfg.sl_pct,
+                    leverage=pos_cfg.leverage or 1,
                 )
             )
+            if report:
+                # reported the moment it settles, so a slow venue never holds back the others
+                task.add_done_callback(partial(_report, ex, symbol, summary, side_tag, about, start_perf))
+            tasks.append(task)
 
-    messages = []
-    for ex, symbol, pcfg, task in tasks:
-        try:
-            await task
-            elapsed = int((time.perf_counter() - start_perf) * 1000)
-            messages.append(
-                f"✅ {rule.side.upper()} {symbol} on {ex.name}\n"
-                f"Nominal≈${pcfg.notional} Lev={pcfg.leverage}x TP={pcfg.tp_pct}% SL={pcfg.sl_pct}% Ref={STOP_PRICE_TYPE}\n"
-                f"Title: {title}\n"
-                f"ReceivedAt: {recv_ts}\n"
-                f"TradedAt: {_now()}\n"
-                f"ExecTime: {elapsed}ms"
-            )
-        except Exception as e:
-            elapsed = int((time.perf_counter() - start_perf) * 1000)
-            messages.append(
-                f"❌ {rule.side.upper()} {symbol} on {ex.name} failed\n"
-                f"{e}\n"
-                f"Nominal≈${pcfg.notional} Lev={pcfg.leverage}x TP={pcfg.tp_pct}% SL={pcfg.sl_pct}% Ref={STOP_PRICE_TYPE}\n"
-                f"Title: {title}\n"
-                f"ReceivedAt: {recv_ts}\n"
-                f"TradedAt: {_now()}\n"
-                f"ExecTime: {elapsed}ms"
-            )
-    for msg in messages:
-        log.info(msg)
-        push_telegram(msg)
+    # the worker stays busy until its trades settle, bounding concurrent announcements
+    await asyncio.gather(*tasks, return_exceptions=True)
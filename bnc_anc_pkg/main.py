@@ -1,6 +1,8 @@
 import asyncio
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
 
 from .config import (
     BINANCE_API_KEY,
@@ -12,54 +14,87 @@ from .config import (
     MEXC_KEY,
     MEXC_SECRET,
     TEST_MODE,
-    TRADING_CONFIG,
-    DECISION_CONFIG,
+    AUTO_ENABLED_EXCHANGES,
+    CFG_REPR,
+    DECISION_REPR,
 )
 from .exchanges.base import ExchangeClient
 from .exchanges.noop import NoOpExchange
 from .exchanges.kucoin import KuCoinFuturesClient
 from .exchanges.mexc import MexcSpotClient
+from .exchanges.session import close_shared_session
 from .ws import run_ws
-from .telegram import push_telegram
-from dataclasses import asdict
+from .telegram import push_telegram, start_telegram, stop_telegram
 
 log = logging.getLogger(__name__)
 
 
-def build_exchanges(enabled: Optional[List[str]] = None) -> List[ExchangeClient]:
-    exchanges: List[ExchangeClient] = []
+ExchangeFactory = Callable[[Optional[aiohttp.ClientSession]], Optional[ExchangeClient]]
+
+
+def _noop(session: Optional[aiohttp.ClientSession]) -> ExchangeClient:
+    return NoOpExchange()
+
+
+def _kucoin(session: Optional[aiohttp.ClientSession]) -> Optional[ExchangeClient]:
+    if not (KC_KEY and KC_SECRET and KC_PASSPHRASE):
+        return None
+    return KuCoinFuturesClient(KC_KEY, KC_SECRET, KC_PASSPHRASE, KC_KEY_VERSION, session=session)
+
+
+def _mexc(session: Optional[aiohttp.ClientSession]) -> Optional[ExchangeClient]:
+    if not (MEXC_KEY and MEXC_SECRET):
+        return None
+    return MexcSpotClient(MEXC_KEY, MEXC_SECRET, session=session)
+
+
+# exchange name -> client factory; None when the exchange's credentials are missing
+REGISTRY: Dict[str, ExchangeFactory] = {"noop": _noop, "kucoin": _kucoin, "mexc": _mexc}
+
+
+def build_exchanges(
+    enabled: Optional[List[str]] = None, session: Optional[aiohttp.ClientSession] = None
+) -> List[ExchangeClient]:
+    """Clients for the enabled exchanges, all on one connection pool (the shared one by default)."""
     if enabled is None:
-        names: List[str] = []
-        for rule in DECISION_CONFIG.values():
-            names.extend(rule.exchanges)
-        if not names and TEST_MODE:
-            names = ["noop"]
-        enabled = sorted(set(names))
+        enabled = AUTO_ENABLED_EXCHANGES or (["noop"] if TEST_MODE else [])
+    exchanges: List[ExchangeClient] = []
     for name in enabled:
-        if name == "noop":
-            exchanges.append(NoOpExchange())
-        elif name == "kucoin":
-            if KC_KEY and KC_SECRET and KC_PASSPHRASE:
-                exchanges.append(
-                    KuCoinFuturesClient(KC_KEY, KC_SECRET, KC_PASSPHRASE, KC_KEY_VERSION)
-                )
-        elif name == "mexc":
-            if MEXC_KEY and MEXC_SECRET:
-                exchanges.append(MexcSpotClient(MEXC_KEY, MEXC_SECRET))
-        else:
+        factory = REGISTRY.get(name)
+        if factory is None:
             raise ValueError(f"Unknown exchange: {name}")
+        ex = factory(session)
+        if ex is not None:
+            exchanges.append(ex)
     return exchanges
 
 
 async def main():
     if not TEST_MODE and not all((BINANCE_API_KEY, BINANCE_API_SECRET, KC_KEY, KC_SECRET, KC_PASSPHRASE)):
         raise SystemExit("Missing required environment variables.")
+    start_telegram()
     exchanges = build_exchanges()
-    cfg = {ex: {m: asdict(mc) for m, mc in markets.items()} for ex, markets in TRADING_CONFIG.items()}
-    msg = f"Trading configuration: {cfg}; decisions: {DECISION_CONFIG}"
+    warmed = await asyncio.gather(*(ex.warm() for ex in exchanges), return_exceptions=True)
+    for ex, res in zip(exchanges, warmed):
+        if isinstance(res, BaseException):
+            # not fatal: the first trade on this exchange pays the cold start instead
+            log.warning("Warm-up failed for %s", ex.name, exc_info=res)
+    msg = f"Trading configuration: {CFG_REPR}; decisions: {DECISION_REPR}"
     log.info(msg)
     push_telegram(msg)
     try:
         await run_ws(exchanges)
     finally:
         await asyncio.gather(*(ex.close() for ex in exchanges), return_exceptions=True)
+        await close_shared_session()
+        await stop_telegram()
+
+
+def run(coro) -> None:
+    """Run a coroutine to completion on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
@@ -1,15 +1,169 @@
-import requests
+import asyncio
+import logging
+import time
+import aiohttp
+import orjson
+from typing import Dict, Optional, Tuple
 from .config import TG_TOKEN, TG_CHAT_ID, TEST_MODE
 
-def push_telegram(text: str) -> None:
-    if TEST_MODE or not TG_TOKEN or not TG_CHAT_ID:
+TG_URL = f"https://api.telegram.org/bot{TG_TOKEN}/sendMessage"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _body_template(**fields) -> bytes:
+    """sendMessage body with every field fixed except the text, filled in per send."""
+    body = {"chat_id": TG_CHAT_ID, "text": "__TEXT__", **fields, "disable_web_page_preview": True}
+    return orjson.dumps(body).replace(b"%", b"%%").replace(b'"__TEXT__"', b"%s")
+
+
+_TG_BODY = _body_template(parse_mode="Markdown")
+# fallback when Telegram rejects the Markdown, e.g. a stray "_" in a title
+_TG_PLAIN_BODY = _body_template()
+
+# notices beyond this backlog are dropped rather than buffered without bound
+TG_QUEUE_MAX = 256
+# notices arriving within this window go out as one sendMessage
+TG_FLUSH_INTERVAL = 0.3
+# Telegram rejects texts over 4096 chars
+TG_MAX_CHARS = 4000
+TG_BATCH_SEP = "\n---\n"
+TG_SEND_ATTEMPTS = 3
+
+log = logging.getLogger(__name__)
+
+# shared keep-alive session, opened once at startup by main()
+TG_SESSION: Optional[aiohttp.ClientSession] = None
+# notifications wait here so callers never await Telegram; created by
+# start_telegram() inside the running loop, which they are bound to
+TG_QUEUE: "Optional[asyncio.Queue[Tuple[str, bool]]]" = None
+# set by urgent notices to cut the current flush window short
+_flush_now: Optional[asyncio.Event] = None
+_worker: Optional[asyncio.Task] = None
+# throttle key -> monotonic time its last notice was queued
+_last_sent: Dict[str, float] = {}
+
+
+def telegram_enabled() -> bool:
+    return not TEST_MODE and bool(TG_TOKEN and TG_CHAT_ID)
+
+
+def push_telegram(text: str, urgent: bool = False) -> None:
+    """Queue a notice; urgent ones (trade results) flush the pending batch at once."""
+    if not telegram_enabled() or TG_QUEUE is None:
         return
     try:
-        url = f"https://api.telegram.org/bot{TG_TOKEN}/sendMessage"
-        requests.post(
-            url,
-            json={"chat_id": TG_CHAT_ID, "text": text, "parse_mode": "Markdown", "disable_web_page_preview": True},
-            timeout=8,
+        TG_QUEUE.put_nowait((text[:TG_MAX_CHARS], urgent))
+    except asyncio.QueueFull:
+        log.warning("Telegram queue full, dropping notice: %.80s", text)
+        return
+    if urgent:
+        _flush_now.set()
+
+
+def push_telegram_throttled(key: str, text: str, min_interval: float = 30.0) -> None:
+    """Queue a status notice unless one with the same key went out within min_interval."""
+    if not telegram_enabled():
+        return
+    now = time.monotonic()
+    last = _last_sent.get(key)
+    if last is not None and now - last < min_interval:
+        return
+    _last_sent[key] = now
+    push_telegram(text)
+
+
+async def _post(body: bytes) -> Tuple[int, bytes]:
+    """POST a sendMessage body, backing off on flood control; returns the last status and body."""
+    for attempt in range(TG_SEND_ATTEMPTS):
+        async with TG_SESSION.post(
+            TG_URL,
+            data=body,
+            headers=_JSON_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as r:
+            raw = await r.read()
+        if r.status != 429 or attempt == TG_SEND_ATTEMPTS - 1:
+            return r.status, raw
+        # flood control: Telegram says how long to back off
+        await asyncio.sleep(orjson.loads(raw).get("parameters", {}).get("retry_after", 1))
+    return 0, b""
+
+
+async def _send(text: str) -> None:
+    quoted = orjson.dumps(text)
+    try:
+        status, raw = await _post(_TG_BODY % quoted)
+        if status == 400:
+            # one unparsable notice must not cost the whole batch, trade reports included
+            status, raw = await _post(_TG_PLAIN_BODY % quoted)
+        if status != 200:
+            log.warning("Telegram sendMessage failed: %s %.200s", status, raw.decode(errors="replace"))
+    except Exception as e:
+        log.warning("Telegram sendMessage failed (%s: %s)", type(e).__name__, e)
+
+
+async def _tg_worker(queue: "asyncio.Queue[Tuple[str, bool]]", flush_now: asyncio.Event) -> None:
+    carry: Optional[Tuple[str, bool]] = None
+    while True:
+        text, urgent = carry or await queue.get()
+        carry = None
+        parts = [text]
+        try:
+            # hold the first notice briefly so a burst shares one POST
+            if not urgent and not flush_now.is_set():
+                try:
+                    await asyncio.wait_for(flush_now.wait(), TG_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            flush_now.clear()
+            size = len(text)
+            while not queue.empty():
+                item = queue.get_nowait()
+                if size + len(TG_BATCH_SEP) + len(item[0]) > TG_MAX_CHARS:
+                    # starts the next batch; task_done once it is sent
+                    carry = item
+                    break
+                parts.append(item[0])
+                size += len(TG_BATCH_SEP) + len(item[0])
+            await _send(TG_BATCH_SEP.join(parts))
+        finally:
+            for _ in parts:
+                queue.task_done()
+
+
+def start_telegram() -> None:
+    global TG_SESSION, TG_QUEUE, _flush_now, _worker
+    if TG_SESSION is None or TG_SESSION.closed:
+        TG_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, ttl_dns_cache=300, resolver=aiohttp.AsyncResolver(), keepalive_timeout=60
+            ),
         )
-    except Exception:
-        pass
+    if _worker is None or _worker.done():
+        TG_QUEUE = asyncio.Queue(maxsize=TG_QUEUE_MAX)
+        _flush_now = asyncio.Event()
+        _worker = asyncio.create_task(_tg_worker(TG_QUEUE, _flush_now))
+
+
+async def stop_telegram(flush_timeout: float = 5.0) -> None:
+    global TG_SESSION, TG_QUEUE, _flush_now, _worker
+    if _worker is not None:
+        # let the worker deliver what is already queued, e.g. shutdown notices
+        if not _worker.done():
+            try:
+                await asyncio.wait_for(TG_QUEUE.join(), flush_timeout)
+            except asyncio.TimeoutError:
+                pass
+        _worker.cancel()
+        try:
+            await _worker
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            log.exception("Telegram worker failed; queued notices were lost")
+        _worker = None
+        TG_QUEUE = None
+        _flush_now = None
+    if TG_SESSION is not None:
+        await TG_SESSION.close()
+        TG_SESSION = None
@@ -1,54 +1,191 @@
-import json
 import asyncio
-import websockets
+import hashlib
+import hmac
+import os
+import random
+import re
+import time
+import aiohttp
+import orjson
 import logging
-from typing import List
-from .config import BINANCE_API_KEY, BINANCE_API_SECRET, BASE_WS, TOPIC
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Union
+from .config import BINANCE_API_KEY, BINANCE_API_SECRET, BASE_WS, TOPIC, CATALOG_FILTER
 from .handler import handle_payload
-from .telegram import push_telegram
+from .telegram import push_telegram_throttled, telegram_enabled
 
 log = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _hmac_template(secret: str) -> "hmac.HMAC":
+    """Keyed HMAC whose copies skip the key setup on every reconnect."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+_QS_PREFIX = f"topic={TOPIC}&recvWindow=60000"
+_urandom = os.urandom
+_time = time.time
+
+
 def build_ws_url(secret: str) -> str:
-    import uuid, time, hmac, hashlib
-    rnd = uuid.uuid4().hex
-    ts = int(time.time() * 1000)
-    qs = f"random={rnd}&topic={TOPIC}&recvWindow=60000&timestamp={ts}"
-    sig = hmac.new(secret.encode(), qs.encode(), hashlib.sha256).hexdigest()
+    qs = f"{_QS_PREFIX}&random={_urandom(16).hex()}&timestamp={int(_time() * 1000)}"
+    h = _hmac_template(secret).copy()
+    h.update(qs.encode())
+    sig = h.hexdigest()
     return f"{BASE_WS}?{qs}&signature={sig}"
 
 
-async def run_ws(exchanges: List[object]):
+# catalogId as it appears inside the escaped "data" string of the envelope
+_RX_CATALOG = re.compile(r'\\?"catalogId\\?"\s*:\s*(\d+)')
+_RX_CATALOG_B = re.compile(_RX_CATALOG.pattern.encode())
+
+
+def _filtered_catalog(raw: Union[str, bytes]) -> bool:
+    """True when the raw frame carries a catalogId outside CATALOG_FILTER."""
+    # re scans bytes in place, so binary frames are never copied into a str
+    m = (_RX_CATALOG_B if isinstance(raw, bytes) else _RX_CATALOG).search(raw)
+    return m is not None and int(m.group(1)) not in CATALOG_FILTER
+
+
+def _parse_frame(raw: Union[str, bytes]) -> Optional[dict]:
+    """Return the announcement payload carried by a DATA frame, else None."""
+    # most frames are not DATA, skip them without a JSON decode
+    if (b'"DATA"' if isinstance(raw, bytes) else '"DATA"') not in raw:
+        return None
+    # filtered categories only matter for the Telegram "ignored" notice
+    if not telegram_enabled() and _filtered_catalog(raw):
+        return None
+    msg_data = orjson.loads(raw)
+    if msg_data.get("type") != "DATA":
+        return None
+    return orjson.loads(msg_data["data"])
+
+
+_DATA_FRAMES = (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY)
+
+RECONNECT_MIN = 1.0
+RECONNECT_MAX = 30.0
+WS_OPEN_TIMEOUT = 5
+WS_CLOSE_TIMEOUT = 1
+WS_MAX_MSG_SIZE = 2**20
+# a flapping link posts each connection-state notice at most this often
+WS_NOTICE_INTERVAL = 30.0
+
+# workers handling announcements at once; later ones wait in the queue
+MAX_INFLIGHT = 8
+# announcements waiting for a worker; beyond this they are dropped
+PENDING_MAX = 64
+SEEN_IDS_MAX = 1024
+_seen_ids: "OrderedDict[object, None]" = OrderedDict()
+
+
+def _dedupe_key(payload: dict) -> object:
+    """Identity of an announcement; news payloads carry no id, so title plus publish time."""
+    key = payload.get("id")
+    if key:
+        return key
+    title = payload.get("title")
+    if not title:
+        return None
+    return title, payload.get("publishDate")
+
+
+def _is_duplicate(payload: dict) -> bool:
+    key = _dedupe_key(payload)
+    return key is not None and key in _seen_ids
+
+
+def _remember(payload: dict) -> None:
+    """Record an announcement that was queued, so redeliveries of it are dropped."""
+    key = _dedupe_key(payload)
+    if key is None:
+        return
+    _seen_ids[key] = None
+    if len(_seen_ids) > SEEN_IDS_MAX:
+        _seen_ids.popitem(last=False)
+
+
+async def _worker(queue: "asyncio.Queue[dict]", exchanges: List[object]):
     while True:
+        payload = await queue.get()
         try:
-            url = build_ws_url(BINANCE_API_SECRET)
-            msg = "Connecting to Binance news WS"
-            log.info(msg)
-            push_telegram(msg)
-            async with websockets.connect(
-                url, additional_headers={"X-MBX-APIKEY": BINANCE_API_KEY}, ping_interval=25, ping_timeout=20
-            ) as ws:
-                msg = "Connected to Binance news WS, listening..."
+            await handle_payload(payload, exchanges)
+        except Exception:
+            log.exception("Failed to handle announcement %s", payload.get("title"))
+        finally:
+            queue.task_done()
+
+
+async def run_ws(exchanges: List[object]):
+    # a fixed pool of workers instead of a task per announcement
+    queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=PENDING_MAX)
+    workers = [asyncio.create_task(_worker(queue, exchanges)) for _ in range(MAX_INFLIGHT)]
+    try:
+        await _listen(queue)
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _listen(queue: "asyncio.Queue[dict]"):
+    # aiohttp instead of websockets so the feed uses the c-ares resolver and
+    # can disable permessage-deflate
+    connector = aiohttp.TCPConnector(ttl_dns_cache=300, resolver=aiohttp.AsyncResolver())
+    timeout = aiohttp.ClientTimeout(total=None, connect=WS_OPEN_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        delay = RECONNECT_MIN
+        while True:
+            try:
+                url = build_ws_url(BINANCE_API_SECRET)
+                msg = "Connecting to Binance news WS"
                 log.info(msg)
-                push_telegram(msg)
-                async for raw in ws:
-                    try:
-                        msg_data = json.loads(raw)
-                        if msg_data.get("type") != "DATA":
+                push_telegram_throttled("ws_connecting", msg, WS_NOTICE_INTERVAL)
+                async with session.ws_connect(
+                    url,
+                    headers={"X-MBX-APIKEY": BINANCE_API_KEY},
+                    heartbeat=25,
+                    compress=0,
+                    max_msg_size=WS_MAX_MSG_SIZE,
+                    timeout=aiohttp.ClientWSTimeout(ws_close=WS_CLOSE_TIMEOUT),
+                ) as ws:
+                    msg = "Connected to Binance news WS, listening..."
+                    log.info(msg)
+                    push_telegram_throttled("ws_connected", msg, WS_NOTICE_INTERVAL)
+                    async for ws_msg in ws:
+                        # binary frames go to orjson as bytes without a str decode
+                        if ws_msg.type not in _DATA_FRAMES:
                             continue
-                        payload = json.loads(msg_data["data"])
-                        asyncio.create_task(handle_payload(payload, exchanges))
-                    except Exception:
-                        pass
-            msg = "Disconnected from Binance news WS"
-            log.warning(msg)
-            push_telegram(msg)
-            msg = "Reconnecting to Binance news WS in 1s"
+                        # a malformed frame is skipped, never a reason to reconnect
+                        try:
+                            payload = _parse_frame(ws_msg.data)
+                            if payload is None:
+                                continue
+                            # the feed is healthy again once announcements flow;
+                            # error/close frames alone keep the backoff growing
+                            delay = RECONNECT_MIN
+                            if _is_duplicate(payload):
+                                continue
+                        except (ValueError, KeyError, TypeError, AttributeError) as e:
+                            log.debug("Skipping malformed news frame: %s", e)
+                            continue
+                        try:
+                            queue.put_nowait(payload)
+                        except asyncio.QueueFull:
+                            log.warning("Announcement backlog full, dropping: %s", payload.get("title"))
+                            continue
+                        # only once queued, so a dropped announcement can still be redelivered
+                        _remember(payload)
+                msg = "Disconnected from Binance news WS"
+                log.warning(msg)
+                push_telegram_throttled("ws_disconnected", msg, WS_NOTICE_INTERVAL)
+            except Exception as e:
+                log.warning("Binance news WS error (%s: %s)", type(e).__name__, e)
+            # exponential backoff with jitter so flapping links don't spin
+            wait = delay + random.random()
+            msg = f"Reconnecting to Binance news WS in {wait:.1f}s"
             log.info(msg)
-            push_telegram(msg)
-            await asyncio.sleep(1)
-        except Exception:
-            msg = "Reconnecting to Binance news WS in 1s"
-            log.warning(msg)
-            push_telegram(msg)
-            await asyncio.sleep(1)
+            push_telegram_throttled("ws_reconnect", msg, WS_NOTICE_INTERVAL)
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, RECONNECT_MAX)
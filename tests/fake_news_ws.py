@@ -8,7 +8,7 @@ os.environ.setdefault("TEST_MODE", "1")
 import websockets
 
 from bnc_anc_pkg.handler import handle_payload
-from bnc_anc_pkg.main import build_exchanges
+from bnc_anc_pkg.main import build_exchanges, run
 
 
 # exchanges to enable for testing
@@ -45,4 +45,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
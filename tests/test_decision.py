@@ -19,3 +19,28 @@ def test_decide_trade_none():
     decision, bases = decide_event_from_title("Some other news")
     assert decision == "none"
     assert bases == []
+
+
+def test_decide_delist_multiple_bases():
+    decision, bases = decide_event_from_title("Binance Will Delist ABC, DEF and GHI on 2025-01-01")
+    assert decision == "delisting"
+    assert bases == ["ABC", "DEF", "GHI"]
+
+
+def test_decide_delisting_word_is_not_delist():
+    decision, bases = decide_event_from_title("Notice on Delisting Schedule Update")
+    assert decision == "none"
+    assert bases == []
+
+
+def test_decide_delisting_takes_precedence():
+    decision, bases = decide_event_from_title("Binance Will List FOO (FOO) and Will Delist BAR")
+    assert decision == "delisting"
+    assert bases == ["BAR"]
+
+
+def test_decision_cache_returns_fresh_lists():
+    decision, bases = decide_event_from_title("Binance Will List Foo (FOO)")
+    bases.append("MUTATED")
+    again = decide_event_from_title("Binance  Will List Foo  (FOO)")
+    assert again == ("listing", ["FOO"])
@@ -1,6 +1,7 @@
 import os, sys, asyncio
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from bnc_anc_pkg.handler import handle_payload
+from bnc_anc_pkg.exchanges.base import COALESCED
 from bnc_anc_pkg.exchanges.noop import NoOpExchange
 
 
@@ -20,3 +21,88 @@ def test_handle_payload_multiple_exchanges():
     asyncio.run(handle_payload(payload, [ex1, ex2]))
     assert len(ex1.calls) == 2
     assert len(ex2.calls) == 2
+
+
+class Failing(NoOpExchange):
+    async def trade(self, **kwargs):
+        raise RuntimeError("boom")
+
+
+def test_handle_payload_failure_does_not_block_others():
+    payload = {"title": "Binance Will List Foo (FOO)", "catalogId": 48}
+    ok = Recorder()
+    asyncio.run(handle_payload(payload, [Failing(), ok]))
+    assert len(ok.calls) == 1
+
+
+class Slow(NoOpExchange):
+    async def trade(self, **kwargs):
+        await asyncio.sleep(0.05)
+        return await super().trade(**kwargs)
+
+
+def test_handle_payload_reports_fast_trades_first(caplog):
+    payload = {"title": "Binance Will List Foo (FOO)", "catalogId": 48}
+    with caplog.at_level("INFO", logger="bnc_anc_pkg.handler"):
+        asyncio.run(handle_payload(payload, [Slow(), Failing()]))
+    reports = [r.getMessage() for r in caplog.records if "FOO on noop" in r.getMessage()]
+    assert len(reports) == 2
+    assert reports[0].startswith("❌") and reports[1].startswith("✅")
+
+
+class Counting(NoOpExchange):
+    def __init__(self):
+        super().__init__()
+        self.orders = 0
+
+    async def _trade(self, **kwargs):
+        self.orders += 1
+        await asyncio.sleep(0.01)
+        return await super()._trade(**kwargs)
+
+
+def test_overlapping_announcements_share_one_order(caplog):
+    first = {"title": "Binance Will List Foo (FOO)", "catalogId": 48}
+    second = {"title": "Binance Will Add Foo (FOO) on Futures", "catalogId": 48}
+    ex = Counting()
+
+    async def run():
+        await asyncio.gather(handle_payload(first, [ex]), handle_payload(second, [ex]))
+        await handle_payload(first, [ex])
+
+    with caplog.at_level("INFO", logger="bnc_anc_pkg.handler"):
+        asyncio.run(run())
+    assert ex.orders == 2
+    reports = [r.getMessage() for r in caplog.records if r.getMessage().startswith("✅")]
+    assert len(reports) == 2
+
+
+def test_orders_with_different_parameters_are_not_joined():
+    ex = Counting()
+
+    async def run():
+        return await asyncio.gather(
+            ex.trade(symbol="FOO", side="buy", notional=10, tp_pct=5, sl_pct=2, leverage=1),
+            ex.trade(symbol="FOO", side="buy", notional=20, tp_pct=5, sl_pct=2, leverage=1),
+            ex.trade(symbol="FOO", side="buy", notional=10, tp_pct=5, sl_pct=2, leverage=1),
+        )
+
+    first, second, joined = asyncio.run(run())
+    assert ex.orders == 2
+    assert first["notional"] == 10 and second["notional"] == 20
+    assert joined is COALESCED
+
+
+def test_sync_decision_runs_inline():
+    payload = {"title": "Binance Will List Foo (FOO)", "catalogId": 48}
+    ex = Recorder()
+
+    async def run():
+        def no_executor(*args):
+            raise AssertionError("decision offloaded to the executor")
+
+        asyncio.get_running_loop().run_in_executor = no_executor
+        await handle_payload(payload, [ex])
+
+    asyncio.run(run())
+    assert len(ex.calls) == 1
@@ -0,0 +1,114 @@
+import os, sys, asyncio
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import bnc_anc_pkg.exchanges.kucoin as kucoin
+from bnc_anc_pkg.exchanges.kucoin import _round_down_to_tick, _round_up_to_tick, _tp_sl_prices
+from bnc_anc_pkg.exchanges.session import close_shared_session
+
+
+def test_round_to_tick():
+    assert _round_down_to_tick(100.127, 0.01) == "100.12"
+    assert _round_up_to_tick(100.121, 0.01) == "100.13"
+    assert _round_down_to_tick(0.30000001, 0.0001) == "0.3000"
+    assert _round_up_to_tick(1.5, 0.5) == "1.5"
+    assert _round_down_to_tick(1234.9, 5.0) == "1230"
+
+
+def test_round_exact_multiple_is_stable():
+    assert _round_down_to_tick(0.3, 0.1) == "0.3"
+    assert _round_up_to_tick(0.3, 0.1) == "0.3"
+    assert _round_down_to_tick(1.15, 0.05) == "1.15"
+    assert _round_up_to_tick(1.15, 0.05) == "1.15"
+
+
+def test_round_tiny_tick_falls_back_to_decimal():
+    assert _round_down_to_tick(1.23456789e-10, 1e-13) == "1.234E-10"
+
+
+def test_round_large_price_with_fine_tick():
+    assert _round_down_to_tick(65432.123456, 0.1) == "65432.1"
+    assert _round_up_to_tick(65432.123456, 0.1) == "65432.2"
+    assert _round_up_to_tick(0.000123456, 0.0000001) == "0.0001235"
+
+
+def test_tp_sl_prices_round_away_from_entry():
+    assert _tp_sl_prices(100.0, 1, 5, 2, 0.01) == ("105.00", "98.00")
+    assert _tp_sl_prices(100.0, -1, 5, 2, 0.01) == ("95.00", "102.00")
+    assert _tp_sl_prices(1.2345, 1, 1, 1, 0.001) == ("1.247", "1.222")
+    assert _tp_sl_prices(1.2345, -1, 1, 1, 0.001) == ("1.222", "1.247")
+
+
+def test_entry_fill_averages_match_events():
+    async def run():
+        c = kucoin.KuCoinFuturesClient("k", "s", "p")
+        c._fills["oid"] = asyncio.get_running_loop().create_future()
+        c._on_entry_update("oid", {"type": "match", "status": "match", "matchPrice": "2.0", "matchSize": "1"})
+        c._on_entry_update("oid", {"type": "match", "status": "match", "matchPrice": "2.3", "matchSize": "2"})
+        assert not c._fills["oid"].done()
+        c._on_entry_update("oid", {"type": "filled", "status": "done"})
+        result = await c._wait_fill("oid")
+        await close_shared_session()
+        return result
+
+    price, size = asyncio.run(run())
+    assert abs(price - 2.2) < 1e-9 and size == 3
+
+
+class Stubbed(kucoin.KuCoinFuturesClient):
+    """Every request succeeds with a filled position; the contract lookup fails `failures` times."""
+
+    def __init__(self, failures, reject_price=None):
+        super().__init__("k", "s", "p")
+        self.failures = failures
+        self.reject_price = reject_price
+        self.posts = []
+        self.cancels = []
+
+    async def _req(self, method, path, j=None, params=None):
+        if method == "DELETE":
+            self.cancels.append(path)
+        if method == "POST":
+            self.posts.append(path)
+            if self.reject_price and j.get("price") == self.reject_price:
+                raise RuntimeError("400 Bad Request")
+        return {"data": {"avgEntryPrice": "2.0", "currentQty": 3, "orderId": f"o{len(self.posts)}"}}
+
+    async def get_contract(self, symbol):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("429 Too Many Requests")
+        return {"tickSize": 0.01}
+
+    async def _ensure_ws(self):
+        pass
+
+
+async def _trade(failures, reject_price=None):
+    c = Stubbed(failures, reject_price)
+    try:
+        return c, await c._trade(symbol="FOOUSDTM", side="buy", notional=10, tp_pct=5, sl_pct=2, leverage=1)
+    except RuntimeError as e:
+        return c, e
+    finally:
+        await close_shared_session()
+
+
+def test_contract_lookup_is_retried_after_entry(monkeypatch):
+    monkeypatch.setattr(kucoin, "CONTRACT_RETRY_DELAY", 0)
+    c, result = asyncio.run(_trade(failures=2))
+    assert result == {"tp": "2.10", "sl": "1.96"}
+    assert c.posts == [kucoin.ST_ORDERS_PATH, kucoin.ORDERS_PATH, kucoin.ORDERS_PATH]
+
+
+def test_failed_contract_lookup_reports_unbracketed_position(monkeypatch):
+    monkeypatch.setattr(kucoin, "CONTRACT_RETRY_DELAY", 0)
+    c, result = asyncio.run(_trade(failures=kucoin.CONTRACT_RETRIES + 1))
+    assert isinstance(result, RuntimeError) and "open without TP/SL" in str(result)
+    assert c.posts == [kucoin.ST_ORDERS_PATH]
+
+
+def test_failed_bracket_leg_cancels_the_other():
+    c, result = asyncio.run(_trade(failures=0, reject_price="1.96"))
+    assert isinstance(result, RuntimeError)
+    assert "open without TP/SL: SL failed (400 Bad Request); TP cancelled" in str(result)
+    assert c.cancels == [f"{kucoin.ORDERS_PATH}/o2"]
+    assert not c._order_pairs
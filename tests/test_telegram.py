@@ -0,0 +1,102 @@
+import os, sys, asyncio
+import orjson
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import bnc_anc_pkg.telegram as tg
+
+
+def test_notices_are_batched_and_urgent_ones_flush(monkeypatch):
+    monkeypatch.setattr(tg, "TEST_MODE", False)
+    monkeypatch.setattr(tg, "TG_TOKEN", "token")
+    monkeypatch.setattr(tg, "TG_CHAT_ID", "1")
+    sent = []
+
+    async def fake_send(text):
+        sent.append(text)
+
+    monkeypatch.setattr(tg, "_send", fake_send)
+
+    async def run():
+        tg.start_telegram()
+        tg.push_telegram("connected")
+        tg.push_telegram("ignored")
+        tg.push_telegram("traded", urgent=True)
+        await asyncio.sleep(0.05)
+        await tg.stop_telegram()
+
+    asyncio.run(run())
+    assert sent == [tg.TG_BATCH_SEP.join(["connected", "ignored", "traded"])]
+
+
+def test_worker_restarts_under_a_new_event_loop(monkeypatch):
+    monkeypatch.setattr(tg, "TEST_MODE", False)
+    monkeypatch.setattr(tg, "TG_TOKEN", "token")
+    monkeypatch.setattr(tg, "TG_CHAT_ID", "1")
+    sent = []
+
+    async def fake_send(text):
+        sent.append(text)
+
+    monkeypatch.setattr(tg, "_send", fake_send)
+
+    async def run(text):
+        tg.start_telegram()
+        # the worker is parked on the empty queue before the notice arrives
+        await asyncio.sleep(0)
+        tg.push_telegram(text, urgent=True)
+        await tg.stop_telegram()
+
+    asyncio.run(run("first"))
+    asyncio.run(run("second"))
+    assert sent == ["first", "second"]
+
+
+def test_throttled_notices_collapse_within_interval(monkeypatch):
+    monkeypatch.setattr(tg, "TEST_MODE", False)
+    monkeypatch.setattr(tg, "TG_TOKEN", "token")
+    monkeypatch.setattr(tg, "TG_CHAT_ID", "1")
+    queued = []
+    monkeypatch.setattr(tg, "push_telegram", queued.append)
+    monkeypatch.setattr(tg, "_last_sent", {})
+    tg.push_telegram_throttled("reconnect", "Reconnecting in 1.2s", 30.0)
+    tg.push_telegram_throttled("reconnect", "Reconnecting in 2.5s", 30.0)
+    tg.push_telegram_throttled("other", "Disconnected", 30.0)
+    tg.push_telegram_throttled("reconnect", "Reconnecting in 4.1s", 0.0)
+    assert queued == ["Reconnecting in 1.2s", "Disconnected", "Reconnecting in 4.1s"]
+
+
+class FakeResponse:
+    def __init__(self, status, raw):
+        self.status, self.raw = status, raw
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self.raw
+
+
+class FakeSession:
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.bodies = []
+
+    def post(self, url, data, **kwargs):
+        self.bodies.append(orjson.loads(data))
+        return FakeResponse(self.statuses.pop(0), b'{"ok":false}')
+
+
+def test_markdown_rejection_resends_as_plain_text(monkeypatch, caplog):
+    session = FakeSession(400, 200)
+    monkeypatch.setattr(tg, "TG_SESSION", session)
+    asyncio.run(tg._send("FOO_BAR ignored\n---\n✅ LONG FOO on kucoin"))
+    assert [b.get("parse_mode") for b in session.bodies] == ["Markdown", None]
+    assert session.bodies[1]["text"] == "FOO_BAR ignored\n---\n✅ LONG FOO on kucoin"
+    assert not caplog.records
+
+    session = FakeSession(400, 400)
+    monkeypatch.setattr(tg, "TG_SESSION", session)
+    asyncio.run(tg._send("still rejected"))
+    assert "sendMessage failed: 400" in caplog.records[-1].getMessage()
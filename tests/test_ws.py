@@ -0,0 +1,95 @@
+import os, sys, json, asyncio
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import aiohttp
+import bnc_anc_pkg.ws as ws
+from bnc_anc_pkg.ws import _is_duplicate, _parse_frame, _remember
+
+
+def test_parse_frame_data():
+    payload = {"title": "Binance Will List Foo (FOO)", "catalogId": 48}
+    raw = json.dumps({"type": "DATA", "data": json.dumps(payload)})
+    assert _parse_frame(raw) == payload
+    assert _parse_frame(raw.encode()) == payload
+
+
+def test_parse_frame_skips_other_types():
+    assert _parse_frame(json.dumps({"type": "COMMAND", "data": "SUCCESS"})) is None
+    assert _parse_frame(b'{"type":"PING","data":"DATA"}') is None
+
+
+def test_duplicate_announcements_are_dropped():
+    payload = {"id": "dup-test-1", "title": "Binance Will List Foo (FOO)"}
+    assert not _is_duplicate(payload)
+    _remember(payload)
+    assert _is_duplicate(dict(payload))
+    assert not _is_duplicate({"id": "dup-test-2", "title": payload["title"]})
+
+
+def test_announcements_without_id_are_keyed_on_publish_date():
+    payload = {"title": "Notice on Scheduled System Upgrade", "publishDate": 1700000000000}
+    _remember(payload)
+    assert _is_duplicate(dict(payload))
+    assert not _is_duplicate({"title": payload["title"], "publishDate": 1700000900000})
+
+
+def test_parse_frame_drops_filtered_catalog_without_telegram():
+    payload = {"title": "Some Binance news", "catalogId": 93}
+    raw = json.dumps({"type": "DATA", "data": json.dumps(payload)})
+    assert _parse_frame(raw) is None
+    assert _parse_frame(raw.encode()) is None
+
+
+
+class Stop(Exception):
+    pass
+
+
+class ErrorOnlyWS:
+    """Accepts the connection, then sends nothing but an error and a close frame."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def __aiter__(self):
+        yield aiohttp.WSMessage(aiohttp.WSMsgType.ERROR, RuntimeError("rejected"), None)
+        yield aiohttp.WSMessage(aiohttp.WSMsgType.CLOSE, 1008, None)
+
+
+class FakeSession:
+    def __init__(self, connector, timeout):
+        self.connector = connector
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.connector.close()
+
+    def ws_connect(self, url, **kwargs):
+        return ErrorOnlyWS()
+
+
+def test_control_frames_do_not_reset_reconnect_backoff(monkeypatch):
+    waits = []
+
+    async def fake_sleep(wait):
+        waits.append(wait)
+        if len(waits) == 3:
+            raise Stop
+
+    monkeypatch.setattr(ws, "BINANCE_API_SECRET", "secret")
+    monkeypatch.setattr(ws.aiohttp, "ClientSession", FakeSession)
+    monkeypatch.setattr(ws.random, "random", lambda: 0.0)
+    monkeypatch.setattr(ws.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        try:
+            await ws._listen(asyncio.Queue())
+        except Stop:
+            pass
+
+    asyncio.run(run())
+    assert waits == [ws.RECONNECT_MIN, ws.RECONNECT_MIN * 2, ws.RECONNECT_MIN * 4]